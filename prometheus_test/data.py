@@ -1,10 +1,6 @@
 import os
-import json
-import base58
-from nacl.signing import SigningKey
 from typing import Dict, Any
-from github import Github
-from prometheus_swarm.tools.github_operations.parser import extract_section
+from .utils import create_signature as sign_payload, load_keypair
 
 
 class DataManager:
@@ -22,6 +18,9 @@ class DataManager:
         # All rounds data
         self.rounds = {}
 
+        # GitHub client, created on first use
+        self._github = None
+
         # Current round data
         self.issue_uuid = None
         self.pr_urls = {}
@@ -44,6 +43,16 @@ class DataManager:
             },
         }
 
+    @property
+    def github(self):
+        """Get GitHub client, initializing if needed"""
+        if self._github is None:
+            # Imported here so loading DataManager doesn't pay for PyGithub
+            from github import Github
+
+            self._github = Github(os.getenv("GITHUB_TOKEN"))
+        return self._github
+
     def _parse_repo_info(self):
         """Parse repository owner and name from fork URL"""
         if not self.fork_url:
@@ -85,16 +94,6 @@ class DataManager:
         self.submission_data = {}
         self.last_completed_step = None
 
-    def _load_keypair(self, keypair_path: str) -> tuple[SigningKey, str]:
-        """Load a keypair from file and return signing key and public key."""
-        with open(keypair_path) as f:
-            keypair_bytes = bytes(json.load(f))
-            private_key = keypair_bytes[:32]
-            signing_key = SigningKey(private_key)
-            verify_key = signing_key.verify_key
-            public_key = base58.b58encode(bytes(verify_key)).decode("utf-8")
-            return signing_key, public_key
-
     def create_signature(self, role: str, payload: Dict[str, Any]) -> Dict[str, str]:
         """Create signatures for a payload using the specified role's keypair."""
         try:
@@ -111,8 +110,8 @@ class DataManager:
                 }
 
             # Load keypairs
-            staking_signing_key, staking_key = self._load_keypair(staking_keypair_path)
-            public_signing_key, pub_key = self._load_keypair(public_keypair_path)
+            staking_signing_key, staking_key = load_keypair(staking_keypair_path)
+            public_signing_key, pub_key = load_keypair(public_keypair_path)
 
             # Add required fields if not present
             if "pubKey" not in payload:
@@ -122,20 +121,9 @@ class DataManager:
             if "githubUsername" not in payload:
                 payload["githubUsername"] = os.getenv(f"{role.upper()}_GITHUB_USERNAME")
 
-            # Convert payload to string with sorted keys
-            payload_str = json.dumps(payload, sort_keys=True).encode()
-
             # Create signatures
-            staking_signed = staking_signing_key.sign(payload_str)
-            public_signed = public_signing_key.sign(payload_str)
-
-            # Combine signatures with payload
-            staking_combined = staking_signed.signature + payload_str
-            public_combined = public_signed.signature + payload_str
-
-            # Encode combined data
-            staking_signature = base58.b58encode(staking_combined).decode()
-            public_signature = base58.b58encode(public_combined).decode()
+            staking_signature = sign_payload(staking_signing_key, payload)
+            public_signature = sign_payload(public_signing_key, payload)
 
             return {
                 "staking_key": staking_key,
@@ -198,17 +186,14 @@ class DataManager:
                 add_pr_signature = "dummy_add_pr_signature"
             else:
                 # Load staking keypair for add-todo-pr signature
-                staking_signing_key, _ = self._load_keypair(staking_keypair_path)
+                staking_signing_key, _ = load_keypair(staking_keypair_path)
 
                 # Update add_pr_payload with staking key and pub key
                 add_pr_payload["stakingKey"] = fetch_signatures["staking_key"]
                 add_pr_payload["pubKey"] = fetch_signatures["pub_key"]
 
                 # Create add-todo-pr signature
-                payload_str = json.dumps(add_pr_payload, sort_keys=True).encode()
-                staking_signed = staking_signing_key.sign(payload_str)
-                staking_combined = staking_signed.signature + payload_str
-                add_pr_signature = base58.b58encode(staking_combined).decode()
+                add_pr_signature = sign_payload(staking_signing_key, add_pr_payload)
         except Exception as e:
             print(f"Error creating add-PR signature: {e}")
             add_pr_signature = "dummy_add_pr_signature"
@@ -231,11 +216,8 @@ class DataManager:
         try:
             staking_keypair_path = self.keypairs[submitter_role]["staking"]
             if staking_keypair_path:
-                staking_signing_key, _ = self._load_keypair(staking_keypair_path)
-                payload_str = json.dumps(payload, sort_keys=True).encode()
-                staking_signed = staking_signing_key.sign(payload_str)
-                staking_combined = staking_signed.signature + payload_str
-                return base58.b58encode(staking_combined).decode()
+                staking_signing_key, _ = load_keypair(staking_keypair_path)
+                return sign_payload(staking_signing_key, payload)
             else:
                 print(f"Warning: No staking keypair path for {submitter_role}")
                 return "dummy_submitter_signature"
@@ -321,17 +303,14 @@ class DataManager:
                 add_pr_signature = "dummy_add_pr_signature"
             else:
                 # Load staking keypair for add-todo-pr signature
-                staking_signing_key, _ = self._load_keypair(staking_keypair_path)
+                staking_signing_key, _ = load_keypair(staking_keypair_path)
 
                 # Update add_pr_payload with staking key and pub key
                 add_pr_payload["stakingKey"] = fetch_signatures["staking_key"]
                 add_pr_payload["pubKey"] = fetch_signatures["pub_key"]
 
                 # Create add-todo-pr signature
-                payload_str = json.dumps(add_pr_payload, sort_keys=True).encode()
-                staking_signed = staking_signing_key.sign(payload_str)
-                staking_combined = staking_signed.signature + payload_str
-                add_pr_signature = base58.b58encode(staking_combined).decode()
+                add_pr_signature = sign_payload(staking_signing_key, add_pr_payload)
         except Exception as e:
             print(f"Error creating add-PR signature: {e}")
             add_pr_signature = "dummy_add_pr_signature"
@@ -349,13 +328,15 @@ class DataManager:
 
     def extract_staking_key_from_pr(self, pr_url: str) -> str:
         """Extract staking key from PR description"""
+        # Imported here so loading DataManager doesn't pay for prometheus_swarm
+        from prometheus_swarm.tools.github_operations.parser import extract_section
+
         parts = pr_url.strip("/").split("/")
         pr_number = int(parts[-1])
         pr_repo_owner = parts[-4]
         pr_repo_name = parts[-3]
 
-        gh = Github(os.getenv("GITHUB_TOKEN"))
-        repo = gh.get_repo(f"{pr_repo_owner}/{pr_repo_name}")
+        repo = self.github.get_repo(f"{pr_repo_owner}/{pr_repo_name}")
         pr = repo.get_pull(pr_number)
 
         staking_section = extract_section(pr.body, "STAKING_KEY")
@@ -460,8 +441,8 @@ class DataManager:
                 }
 
             # Load keypairs
-            _, staking_key = self._load_keypair(staking_keypair_path)
-            _, pub_key = self._load_keypair(public_keypair_path)
+            _, staking_key = load_keypair(staking_keypair_path)
+            _, pub_key = load_keypair(public_keypair_path)
 
             return {
                 "staking_key": staking_key,
@@ -8,6 +8,12 @@ from .workers import TestEnvironment
 import yaml
 import os
 
+# Use the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 
 class MongoCollectionConfig(TypedDict, total=False):
     data_file: str  # Optional, not all collections need data files
@@ -58,7 +64,7 @@ class TestConfig:
         """Create TestConfig from a YAML file"""
         # Load YAML config
         with open(yaml_path) as f:
-            config = yaml.safe_load(f) or {}
+            config = yaml.load(f, Loader=_SafeLoader) or {}
 
         # Use base_dir from argument or yaml_path's parent
         base_dir = base_dir or yaml_path.parent
@@ -202,6 +208,7 @@ class TestRunner:
             bool: True if all collections exist and have required document counts
         """
         db = self.mongo_client[self.config.mongodb["database"]]
+        existing_collections = set(db.list_collection_names())
 
         for coll_name, coll_config in self.config.mongodb["collections"].items():
             # Skip if collection doesn't exist and no documents required
@@ -209,7 +216,7 @@ class TestRunner:
                 continue
 
             # Check if collection exists and has required documents
-            if coll_name not in db.list_collection_names():
+            if coll_name not in existing_collections:
                 print(f"Collection {coll_name} does not exist")
                 return False
 
@@ -261,6 +268,10 @@ class TestRunner:
                 if not isinstance(data, list):
                     data = [data]
 
+                # Nothing to insert; insert_many rejects an empty list
+                if not data:
+                    continue
+
                 # Add task_id to all documents
                 for item in data:
                     item["taskId"] = self.config.task_id
@@ -387,21 +398,22 @@ class TestRunner:
                 f"\nResuming from step {self.last_completed_step} in round {self.current_round}..."
             )
 
+        # Map each step name to the index of the step after it, built once for all rounds.
+        # The first step with a given name wins, matching a linear search.
+        resume_index = {}
+        for i, step in enumerate(self.steps):
+            resume_index.setdefault(step.name, i + 1)
+
         try:
             with self.run_environment():
                 while self.current_round <= self.max_rounds:
-                    round_steps = [s for s in self.steps]
-
                     # Find the index to start from based on last completed step
                     start_index = 0
                     if self.last_completed_step:
-                        for i, step in enumerate(round_steps):
-                            if step.name == self.last_completed_step:
-                                start_index = i + 1
-                                break
+                        start_index = resume_index.get(self.last_completed_step, 0)
 
                     # Skip already completed steps
-                    for step in round_steps[start_index:]:
+                    for step in self.steps[start_index:]:
                         self.log_step(step)
 
                         worker = self.get_worker(step.worker)
@@ -1,11 +1,21 @@
+import os
 import json
 import base58
+from functools import lru_cache
 from nacl.signing import SigningKey
 from typing import Dict, Any, Tuple
 
 
 def load_keypair(keypair_path: str) -> Tuple[SigningKey, str]:
-    """Load a keypair from file and return signing key and public key."""
+    """Load a keypair from file and return signing key and public key.
+
+    Results are cached per (path, mtime), so a replaced keypair file is re-read.
+    """
+    return _load_keypair(keypair_path, os.stat(keypair_path).st_mtime_ns)
+
+
+@lru_cache(maxsize=16)
+def _load_keypair(keypair_path: str, mtime_ns: int) -> Tuple[SigningKey, str]:
     with open(keypair_path) as f:
         keypair_bytes = bytes(json.load(f))
         private_key = keypair_bytes[:32]